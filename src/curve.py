@@ -5,7 +5,7 @@ from typing import TypeVar, override
 TPoint = TypeVar("TPoint", bound="AffinePoint")
 
 
-@dataclass
+@dataclass(slots=True)
 class AffinePoint:
     x: int
     y: int
@@ -37,15 +37,20 @@ class DoubleAndAddCurve(Curve):
 
     @override
     def scalar_mult(self, R: Point, scalar: int) -> Point:
-        if R is IdentityPoint:
+        """
+        Left-to-right double-and-add over the bits of the scalar.
+
+        Starting from R at the top bit saves the final doubling of the right-to-left
+        variant, and every addition adds the same point R.
+        """
+        if R is IdentityPoint or scalar <= 0:
             return IdentityPoint
 
-        Q = None
-        while scalar > 0:
-            if scalar % 2 == 1:
-                Q = R if Q is None else self.add(Q, R)
-            R = self.double(R)
-            scalar //= 2
+        Q: Point = R
+        for i in reversed(range(scalar.bit_length() - 1)):
+            Q = self.double(Q)
+            if (scalar >> i) & 1:
+                Q = self.add(Q, R)
         return Q
 
     @abstractmethod
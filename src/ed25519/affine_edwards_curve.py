@@ -1,8 +1,8 @@
 from typing import override
 
 from curve import AffinePoint, IdentityPoint, Point
-from ed25519.edwards_curve import EdwardsCurve
-from util import modinv, sqrt_mod
+from ed25519.edwards_curve import EdwardsCurve, ExtendedCoordinates
+from util import modinv, pow_p58
 
 
 class AffineEdwardsCurve(EdwardsCurve):  # type: ignore
@@ -29,9 +29,9 @@ class AffineEdwardsCurve(EdwardsCurve):  # type: ignore
         p = self.p
         d = self.d
 
-        denom = d * x1 * x2 * y1 * y2
-        inv_denom_x = modinv((1 + denom) % p, p)
-        inv_denom_y = modinv((1 - denom) % p, p)
+        # Reduce the product once, 1 + denom and 1 - denom only feed into multiplications.
+        denom = d * x1 * x2 % p * y1 * y2 % p
+        inv_denom_x, inv_denom_y = self._invert_pair(1 + denom, 1 - denom)
         x3 = ((x1 * y2 + x2 * y1) * inv_denom_x) % p
         y3 = ((x1 * x2 + y1 * y2) * inv_denom_y) % p
         return AffinePoint(x3, y3)
@@ -44,6 +44,7 @@ class AffineEdwardsCurve(EdwardsCurve):  # type: ignore
             x3 = (x1*y1+y1*x1)/(1+d*x1*x1*y1*y1)
             y3 = (y1*y1-a*x1*x1)/(1-d*x1*x1*y1*y1)
         from: https://www.hyperelliptic.org/EFD/g1p/auto-twisted.html
+        With a = -1 the numerator of y3 is y1*y1 + x1*x1.
         """
         if R is IdentityPoint:
             return IdentityPoint
@@ -52,13 +53,33 @@ class AffineEdwardsCurve(EdwardsCurve):  # type: ignore
         p = self.p
         d = self.d
 
-        denom = d * x1 * x1 * y1 * y1
-        inv_denom_x = modinv((1 + denom) % p, p)
-        inv_denom_y = modinv((1 - denom) % p, p)
-        x3 = ((x1 * y1 + y1 * x1) * inv_denom_x) % p
-        y3 = ((y1 * y1 - self.a * x1 * x1) * inv_denom_y) % p
+        xy = x1 * y1 % p
+        denom = d * xy % p * xy % p
+        inv_denom_x, inv_denom_y = self._invert_pair(1 + denom, 1 - denom)
+        x3 = (2 * xy * inv_denom_x) % p
+        y3 = ((y1 * y1 + x1 * x1) * inv_denom_y) % p
         return AffinePoint(x3, y3)
 
+    def _invert_pair(self, u: int, v: int) -> tuple[int, int]:
+        """
+        Invert u and v with a single inversion (Montgomery's trick).
+
+        With w = (u*v)^-1 we get u^-1 = v*w and v^-1 = u*w.
+        """
+        w = modinv(u * v % self.p, self.p)
+        return v * w % self.p, u * w % self.p
+
+    @override
+    def _to_extended(self, P: Point) -> ExtendedCoordinates:  # type: ignore
+        return P.x, P.y, 1, P.x * P.y % self.p  # type: ignore
+
+    @override
+    def _from_extended(self, P: ExtendedCoordinates) -> Point:
+        """Convert (X, Y, Z, T) to affine coordinates with a single inversion."""
+        X, Y, Z, _ = P
+        z_inv = modinv(Z, self.p)
+        return AffinePoint(X * z_inv % self.p, Y * z_inv % self.p)
+
     def compress(self, P: Point) -> bytes:
         """
         Compress a point P = (x, y) into a 32-byte string using the Ed25519 convention:
@@ -69,14 +90,8 @@ class AffineEdwardsCurve(EdwardsCurve):  # type: ignore
         if P is IdentityPoint:
             raise ValueError("Cannot compress Identity Element")
 
-        x, y = P.x, P.y
-        y_bytes = y.to_bytes(32, "little")
-        y_arr = bytearray(y_bytes)
-        if x & 1:  # if odd, y is positive
-            y_arr[31] |= 0x80
-        else:  # if even, y is negative
-            y_arr[31] &= 0x7F
-        return bytes(y_arr)
+        # y < p < 2^255, so bit 255 is free to hold the sign of x
+        return (P.y | ((P.x & 1) << 255)).to_bytes(32, "little")
 
     def uncompress(self, comp: bytes) -> Point:
         """
@@ -89,31 +104,37 @@ class AffineEdwardsCurve(EdwardsCurve):  # type: ignore
         To recover x, use the curve equation:
            -x^2 + y^2 = 1 + d*x^2*y^2.
         Rearranged to:
-           x^2 = (y^2 - 1) / (d*y^2 + 1)   (mod p)
-        and then take a square root (using sqrt_mod).
+           x^2 = (y^2 - 1) / (d*y^2 + 1) = u / v   (mod p)
+        and then take a square root, fused with the division into one exponentiation.
         """
         if len(comp) != 32:
             raise ValueError("Compressed point must be 32 bytes")
 
-        comp_arr = bytearray(comp)
-        sign = (comp_arr[31] >> 7) & 1  # Recover the sign of y
-        comp_arr[31] &= 0x7F  # Reset the sign bit
-
-        dx = int.from_bytes(comp_arr, "little")
+        raw = int.from_bytes(comp, "little")
+        sign = raw >> 255  # Recover the sign of x
+        dx = raw & ((1 << 255) - 1)  # Reset the sign bit
         if dx >= self.p:
             raise ValueError("Decoded y is not in field range")
         dx_squared = (dx * dx) % self.p
         u = (dx_squared - 1) % self.p
         v = (self.d * dx_squared + 1) % self.p
-        x_sq = (u * modinv(v, self.p)) % self.p
-        x = sqrt_mod(x_sq, self.p)
+        # Candidate root of u/v without inverting v: x = u*v^3 * (u*v^7)^((p-5)/8).
+        # It is a root of either u/v or -u/v (RFC 8032, section 5.1.3).
+        p = self.p
+        v3 = v * v % p * v % p
+        x = u * v3 % p * pow_p58(u * v3 % p * v3 % p * v % p) % p
+        vx2 = v * x % p * x % p
+        if vx2 != u:
+            if vx2 != (-u) % p:
+                raise ValueError("No square root exists for the given input.")
+            x = (x * self._sqrt_m1) % p
         if (x & 1) != sign:
             x = (-x) % self.p
         return AffinePoint(x, dx)
 
     @override
     def point_equals(self, P: Point, Q: Point) -> bool:  # type: ignore
-        if P is IdentityPoint or Q is IdentityPoint:
-            return True
-
-        return P.x == Q.x and P.y == Q.y  # type: ignore
+        """IdentityPoint is compared as the neutral element (0, 1)."""
+        x1, y1 = (0, 1) if P is IdentityPoint else (P.x, P.y)
+        x2, y2 = (0, 1) if Q is IdentityPoint else (Q.x, Q.y)
+        return x1 == x2 and y1 == y2
@@ -1,11 +1,18 @@
 from abc import abstractmethod
 from dataclasses import dataclass
+from typing import override
 
-from curve import AffinePoint, DoubleAndAddCurve, Point
-from util import modinv
+from curve import AffinePoint, DoubleAndAddCurve, IdentityPoint, Point
+from util import SQRT_M1_25519, WNAF_WIDTH, modinv, wnaf
 
+# Extended homogeneous coordinates (X, Y, Z, T) with x = X/Z, y = Y/Z and x*y = T/Z.
+ExtendedCoordinates = tuple[int, int, int, int]
 
-@dataclass
+# The neutral element (0, 1) in extended homogeneous coordinates.
+_IDENTITY: ExtendedCoordinates = (0, 1, 1, 0)
+
+
+@dataclass(slots=True)
 class ExtendedPoint(AffinePoint):  # type: ignore
     z: int
     t: int
@@ -17,6 +24,9 @@ class EdwardsCurve(DoubleAndAddCurve):  # type: ignore
 
     Every (non-identity) point supports addition, scalar multiplication, and doubling.
     Identity is denoted by None.
+
+    Scalar multiplication is carried out in extended homogeneous coordinates for every
+    representation, sub-classes only convert to and from them at the boundary.
     """
 
     def __init__(self) -> None:
@@ -24,12 +34,233 @@ class EdwardsCurve(DoubleAndAddCurve):  # type: ignore
         self.p = 2**255 - 19
         # The Edwards curve constant for Ed25519.
         self.d = (-121665 * modinv(121666, self.p)) % self.p
+        self.d2 = (2 * self.d) % self.p
+        # sqrt(-1), to fix up square roots modulo p = 5 (mod 8), see uncompress.
+        self._sqrt_m1 = SQRT_M1_25519
         # The subgroup order for Ed25519.
         self.q = 2**252 + 27742317777372353535851937790883648493
         self.B = AffinePoint(
             15112221349535400772501151409588531511454012693041857206046113283949847762202,
             46316835694926478169428394003475163141307993866256225615783033603165251855960,
         )
+        self._B_comb = self._comb_table(
+            (self.B.x, self.B.y, 1, self.B.x * self.B.y % self.p)
+        )
+
+    @override
+    def scalar_mult(self, R: Point, scalar: int) -> Point:
+        """
+        Signed-window (wNAF) scalar multiplication on extended homogeneous coordinates.
+
+        The table of odd multiples of R is computed on the fly. None of the steps needs
+        an inversion, the only one is paid by _from_extended (if the representation
+        needs it at all).
+        """
+        if R is IdentityPoint:
+            return IdentityPoint
+
+        table = self._odd_multiples(self._to_extended(R))
+        return self._wnaf_mult(table, scalar)
+
+    def scalar_mult_fixed_base(self, scalar: int) -> Point:
+        """
+        Compute scalar * B with the comb table of B precomputed in __init__.
+
+        The scalar is written in 64 signed radix-16 digits e_i in [-8, 8], then
+        scalar * B = sum(e_i * 16^i * B). Row j of the table holds 1..8 times 256^j * B,
+        which serves the odd digits e_(2j+1) * 16 * 256^j * B and the even digits
+        e_(2j) * 256^j * B. Summing the odd digits first and multiplying by 16 costs 64
+        additions and only 4 doublings, instead of one doubling per bit.
+        """
+        return self._from_extended(self._comb_mult(scalar))
+
+    def montgomery_u_fixed_base(self, scalar: int) -> int:
+        """
+        Return the Curve25519 u-coordinate of scalar * B.
+
+        Uses the comb table of B and the birational map u = (1 + y) / (1 - y), which in
+        extended coordinates is u = (Z + Y) / (Z - Y). B maps to the X25519 base point
+        u = 9, and the neutral element maps to u = 0.
+        """
+        _, Y, Z, _ = self._comb_mult(scalar)
+        return (Z + Y) * modinv(Z - Y, self.p) % self.p
+
+    def _comb_mult(self, scalar: int) -> ExtendedCoordinates:
+        """Compute scalar * B in extended coordinates, see scalar_mult_fixed_base."""
+        digits = self._signed_radix16(scalar % self.q)
+        add = self._extended_add
+        double = self._extended_double
+
+        Q = _IDENTITY
+        for row, digit in zip(self._B_comb, digits[1::2], strict=True):
+            if digit:
+                Q = add(Q, row[digit - 1 if digit > 0 else digit])
+        Q = double(double(double(double(Q))))
+        for row, digit in zip(self._B_comb, digits[::2], strict=True):
+            if digit:
+                Q = add(Q, row[digit - 1 if digit > 0 else digit])
+        return Q
+
+    @staticmethod
+    def _signed_radix16(scalar: int) -> list[int]:
+        """
+        Write a scalar below 2^255 as 64 digits e_i in [-8, 8] (least-significant first).
+
+        Starting from the nibbles of the scalar, every digit of 8 or more borrows 16 from
+        itself and carries 1 into the next digit.
+        """
+        digits = [(scalar >> (4 * i)) & 15 for i in range(64)]
+        carry = 0
+        for i in range(63):
+            digit = digits[i] + carry
+            carry = (digit + 8) >> 4
+            digits[i] = digit - (carry << 4)
+        digits[63] += carry
+        return digits
+
+    def _comb_table(self, P: ExtendedCoordinates) -> list[list[ExtendedCoordinates]]:
+        """
+        Return the rows [P_j, 2 P_j, ..., 8 P_j, -8 P_j, ..., -P_j] for P_j = 256^j * P.
+
+        With this layout row[digit - 1] is digit * P_j for digit in 1..8 and row[digit]
+        is digit * P_j for digit in -8..-1.
+        """
+        add = self._extended_add
+        double = self._extended_double
+        table = []
+        for _ in range(32):
+            row = [P]
+            for _ in range(7):
+                row.append(add(row[-1], P))
+            table.append(row + [self._extended_neg(T) for T in reversed(row)])
+            # 8P -> 256P
+            P = double(double(double(double(double(row[-1])))))
+        return table
+
+    def _wnaf_mult(self, table: list[ExtendedCoordinates], scalar: int) -> Point:
+        """
+        Compute scalar * P given table = [P, 3P, 5P, ..., 15P].
+
+        Digits are processed from the most significant one, doubling once per digit and
+        adding (or subtracting) a table entry for every non-zero digit. The loop only
+        touches locals, so no attribute lookups are paid per digit.
+        """
+        lookup = self._signed_lookup(table)
+        add = self._extended_add
+        double = self._extended_double
+
+        # The extended formulas are complete, so starting from the neutral element
+        # needs no special case for the first non-zero digit.
+        Q = _IDENTITY
+        for digit in reversed(wnaf(scalar, WNAF_WIDTH)):
+            Q = double(Q)
+            if digit:
+                Q = add(Q, lookup[digit // 2])
+        return self._from_extended(Q)
+
+    def multi_scalar_mult(self, points: list[Point], scalars: list[int]) -> Point:
+        """
+        Compute the sum of scalars[i] * points[i] (Straus' method, interleaved wNAF).
+
+        All terms share a single chain of doublings, so n terms cost about as many
+        doublings as one scalar multiplication (of the longest scalar) plus the
+        additions of each term. Scalars may be negative.
+        """
+        lookups = []
+        digits = []
+        for P, scalar in zip(points, scalars, strict=True):
+            if P is IdentityPoint:
+                continue
+            lookups.append(self._signed_lookup(self._odd_multiples(self._to_extended(P))))
+            if scalar < 0:
+                digits.append([-digit for digit in wnaf(-scalar, WNAF_WIDTH)])
+            else:
+                digits.append(wnaf(scalar, WNAF_WIDTH))
+
+        add = self._extended_add
+        double = self._extended_double
+        Q = _IDENTITY
+        for i in reversed(range(max(map(len, digits), default=0))):
+            Q = double(Q)
+            for lookup, ds in zip(lookups, digits, strict=True):
+                if i < len(ds) and ds[i]:
+                    Q = add(Q, lookup[ds[i] // 2])
+        return self._from_extended(Q)
+
+    def _signed_lookup(
+        self, table: list[ExtendedCoordinates]
+    ) -> list[ExtendedCoordinates]:
+        """
+        Extend [P, 3P, ..., 15P] by the negated entries in reverse order.
+
+        Then lookup[digit // 2] is digit * P for positive and negative odd digits alike
+        (e.g. -1 // 2 == -1 picks -P).
+        """
+        return table + [self._extended_neg(T) for T in reversed(table)]
+
+    def _odd_multiples(self, P: ExtendedCoordinates) -> list[ExtendedCoordinates]:
+        """Return [P, 3P, 5P, ..., (2^(w-1) - 1)P] for the wNAF window width w."""
+        P2 = self._extended_double(P)
+        table = [P]
+        for _ in range(2 ** (WNAF_WIDTH - 2) - 1):
+            table.append(self._extended_add(table[-1], P2))
+        return table
+
+    def _extended_neg(self, P: ExtendedCoordinates) -> ExtendedCoordinates:
+        """Negate a point, on a twisted Edwards curve -(x, y) = (-x, y)."""
+        X, Y, Z, T = P
+        return -X % self.p, Y, Z, -T % self.p
+
+    def _extended_add(
+        self, P: ExtendedCoordinates, Q: ExtendedCoordinates
+    ) -> ExtendedCoordinates:
+        """
+        Add two points in extended homogeneous coordinates.
+        Runs in 8M + 1D (here M does not account for multiplications with constants).
+        Section 3.1 of https://eprint.iacr.org/2008/522.pdf
+        """
+        X1, Y1, Z1, T1 = P
+        X2, Y2, Z2, T2 = Q
+        p = self.p
+
+        A = (Y1 - X1) * (Y2 - X2) % p
+        B = (Y1 + X1) * (Y2 + X2) % p
+        C = self.d2 * T1 * T2 % p
+        D = 2 * Z1 * Z2 % p
+
+        E = B - A
+        F = D - C
+        G = D + C
+        H = B + A
+        return E * F % p, G * H % p, F * G % p, E * H % p
+
+    def _extended_double(self, P: ExtendedCoordinates) -> ExtendedCoordinates:
+        """
+        Double a point in extended homogeneous coordinates (for a = -1).
+        Runs in 4M + 4S, the input T is not needed.
+        Section 3.3 of https://eprint.iacr.org/2008/522.pdf
+        """
+        X1, Y1, Z1, _ = P
+        p = self.p
+
+        A = X1 * X1 % p
+        B = Y1 * Y1 % p
+        C = 2 * Z1 * Z1 % p
+        H = A + B
+        E = H - (X1 + Y1) * (X1 + Y1) % p
+        G = A - B
+        F = C + G
+        return E * F % p, G * H % p, F * G % p, E * H % p
+
+    @abstractmethod
+    def _to_extended(self, P: Point) -> ExtendedCoordinates:
+        """Convert a (non-identity) point of this representation to (X, Y, Z, T)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def _from_extended(self, P: ExtendedCoordinates) -> Point:
+        """Convert (X, Y, Z, T) back to a point of this representation."""
+        raise NotImplementedError
 
     @abstractmethod
     def compress(self, point: Point) -> bytes:
@@ -1,7 +1,9 @@
+from typing import override
+
 from curve import AffinePoint, IdentityPoint, Point
 from ed25519.affine_edwards_curve import AffineEdwardsCurve
-from ed25519.edwards_curve import ExtendedPoint
-from util import projective_to_affine
+from ed25519.edwards_curve import _IDENTITY, ExtendedCoordinates, ExtendedPoint
+from util import modinv
 
 
 class ExtendedEdwardsCurve(AffineEdwardsCurve):  # type: ignore
@@ -15,29 +17,14 @@ class ExtendedEdwardsCurve(AffineEdwardsCurve):  # type: ignore
         """
         Add two points P and Q on the curve using extended homogeneous coordinates.
         Runs in 8M + 1D (here M does not account for multiplications with constants).
-        Section 3.2 of https://eprint.iacr.org/2008/522.pdf
+        Section 3.1 of https://eprint.iacr.org/2008/522.pdf
         """
         if P is IdentityPoint or Q is IdentityPoint:
-            return P if P is IdentityPoint else Q
-
-        X1, Y1, Z1, T1 = P.x, P.y, P.z, P.t
-        X2, Y2, Z2, T2 = Q.x, Q.y, Q.z, Q.t
-
-        A = (Y1 - X1) * (Y2 - X2) % self.p
-        B = (Y1 + X1) * (Y2 + X2) % self.p
-        C = 2 * self.d * T1 * T2 % self.p
-        D = 2 * Z1 * Z2 % self.p
+            return Q if P is IdentityPoint else P
 
-        E = B - A
-        F = D - C
-        G = D + C
-        H = B + A
-        X3 = E * F % self.p
-        Y3 = G * H % self.p
-        T3 = E * H % self.p
-        Z3 = F * G % self.p
-
-        return ExtendedPoint(X3, Y3, Z3, T3)
+        return self._from_extended(
+            self._extended_add(self._to_extended(P), self._to_extended(Q))
+        )
 
     def double(self, P: Point) -> Point:
         """
@@ -45,25 +32,23 @@ class ExtendedEdwardsCurve(AffineEdwardsCurve):  # type: ignore
         Implements formula 7 of this paper https://eprint.iacr.org/2008/522.pdf
         that is derived from doubling in extended coordinates (X, Y, Z)
         https://eprint.iacr.org/2008/013.pdf
-        Runs in 4M + 4S + 1D (S for Squarings)
+        Runs in 4M + 4S (S for Squarings), a = -1 saves the multiplication by a.
         """
         if P is IdentityPoint:
             return IdentityPoint
 
-        A = P.x**2 % self.p
-        B = P.y**2 % self.p
-        C = 2 * P.z**2 % self.p
-        D = self.a * A % self.p
-        E = (P.x + P.y) ** 2 - A - B % self.p
-        G = D + B % self.p
-        F = G - C % self.p
-        H = D - B % self.p
-        X3 = E * F % self.p
-        Y3 = G * H % self.p
-        T3 = E * H % self.p
-        Z3 = F * G % self.p
-
-        return ExtendedPoint(X3, Y3, Z3, T3)
+        return self._from_extended(self._extended_double(self._to_extended(P)))
+
+    @override
+    def _to_extended(self, P: Point) -> ExtendedCoordinates:
+        if type(P) is ExtendedPoint:
+            return P.x, P.y, P.z, P.t
+        # Affine input, build the tuple directly instead of an ExtendedPoint first.
+        return P.x, P.y, 1, P.x * P.y % self.p  # type: ignore
+
+    @override
+    def _from_extended(self, P: ExtendedCoordinates) -> ExtendedPoint:
+        return ExtendedPoint(*P)
 
     def _from_affine(self, point: Point) -> Point:
         """Convert a point from affine coordinates to extended homogeneous coordinates."""
@@ -77,10 +62,8 @@ class ExtendedEdwardsCurve(AffineEdwardsCurve):  # type: ignore
         if P is IdentityPoint:
             return IdentityPoint
 
-        return AffinePoint(
-            projective_to_affine(P.x, P.z, self.p),
-            projective_to_affine(P.y, P.z, self.p),
-        )
+        z_inv = modinv(P.z, self.p)
+        return AffinePoint(P.x * z_inv % self.p, P.y * z_inv % self.p)
 
     def compress(self, point: Point) -> bytes:
         return super().compress(self._to_affine(point))  # type: ignore
@@ -89,4 +72,13 @@ class ExtendedEdwardsCurve(AffineEdwardsCurve):  # type: ignore
         return self._from_affine(super().uncompress(comp))
 
     def point_equals(self, P: Point, Q: Point) -> bool:
-        return super().point_equals(self._to_affine(P), self._to_affine(Q))  # type: ignore
+        """
+        Compare projectively, X1/Z1 = X2/Z2 iff X1*Z2 = X2*Z1, without inversions.
+
+        IdentityPoint is compared as the neutral element (0, 1), so it only equals
+        itself or a regular point representing (0, 1).
+        """
+        X1, Y1, Z1, _ = _IDENTITY if P is IdentityPoint else self._to_extended(P)
+        X2, Y2, Z2, _ = _IDENTITY if Q is IdentityPoint else self._to_extended(Q)
+        p = self.p
+        return (X1 * Z2 - X2 * Z1) % p == 0 and (Y1 * Z2 - Y2 * Z1) % p == 0
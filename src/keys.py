@@ -4,7 +4,7 @@ from dataclasses import dataclass
 KEY_SIZE = 32
 
 
-@dataclass
+@dataclass(slots=True)
 class Key:
     _key: bytes
 
@@ -20,19 +20,16 @@ class Key:
         return self._key
 
 
-@dataclass
+@dataclass(slots=True, init=False)
 class PrivateKey(Key):
-    def __init__(self, key: bytes | None = None):
-        super().__init__(key)
+    pass
 
 
-@dataclass
+@dataclass(slots=True, init=False)
 class PublicKey(Key):
-    def __init__(self, key: bytes | None = None):
-        super().__init__(key)
+    pass
 
 
-@dataclass
+@dataclass(slots=True, init=False)
 class SharedKey(Key):
-    def __init__(self, key: bytes | None = None):
-        super().__init__(key)
+    pass
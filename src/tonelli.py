@@ -1,6 +1,14 @@
 # Translated into Python from postscript code found here:
 # https://github.com/mvaneerde/blog/blob/develop/tonelli-shanks/tonelli-shanks.ps1
 
+from functools import lru_cache
+
+from util import sqrt_mod
+
+# The smallest quadratic non-residue modulo a prime is itself a prime: every product of
+# smaller (residue) primes is a residue. Checking these first covers virtually all p.
+SMALL_NONRESIDUE_CANDIDATES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47)
+
 
 def decompose(n: int) -> tuple[int, int]:
     """
@@ -11,14 +19,12 @@ def decompose(n: int) -> tuple[int, int]:
     Returns:
         A tuple (q, s) such that n = q * 2^s and q is odd.
     """
-    if n < 0:
+    if n <= 0:
         raise ValueError(f"n must be positive, but got n = {n}")
 
-    s = 0
-    while n % 2 == 0:
-        s += 1
-        n //= 2
-    return n, s
+    # n & -n isolates the lowest set bit, its position is the number of trailing zeros.
+    s = (n & -n).bit_length() - 1
+    return n >> s, s
 
 
 def legendre(a: int, p: int) -> int:
@@ -47,9 +53,24 @@ def legendre_symbol(a: int, p: int) -> int:
         1 if a is a quadratic residue modulo p,
        -1 if a is a non-residue,
         0 if a is divisible by p.
+
+    Evaluated as a Jacobi symbol with quadratic reciprocity (a binary-GCD-like loop on
+    shrinking numbers) instead of Euler's criterion, which needs a full exponentiation.
     """
-    ls = legendre(a, p)
-    return -1 if ls == p - 1 else ls
+    a %= p
+    result = 1
+    while a:
+        # (2/n) = -1 iff n = 3, 5 (mod 8)
+        while not a & 1:
+            a >>= 1
+            if p & 7 in (3, 5):
+                result = -result
+        # Reciprocity: (a/n) = -(n/a) iff a = n = 3 (mod 4)
+        a, p = p, a
+        if a & 3 == 3 and p & 3 == 3:
+            result = -result
+        a %= p
+    return result if p == 1 else 0
 
 
 def is_quadratic_residue(n: int, p: int) -> bool:
@@ -84,13 +105,29 @@ def find_nonsquare(p: int) -> int:
     Raises:
         ValueError: If no quadratic non-residue is found (should not occur for prime p).
     """
-    for z in range(2, p):
+    for z in SMALL_NONRESIDUE_CANDIDATES:
+        if z < p and legendre_symbol(z, p) == -1:
+            return z
+
+    for z in range(SMALL_NONRESIDUE_CANDIDATES[-1] + 1, p):
         if legendre_symbol(z, p) == -1:
             return z
 
     raise ValueError(f"Could not find a quadratic non-residue modulo {p}")
 
 
+@lru_cache(maxsize=16)
+def _tonelli_context(p: int) -> tuple[int, int, int]:
+    """
+    Return (q, s, c) for p - 1 = q * 2^s with q odd and c = z^q for a non-residue z.
+
+    All three only depend on p, so they are computed once per modulus.
+    """
+    q, s = decompose(p - 1)
+    z = find_nonsquare(p)
+    return q, s, pow(z, q, p)
+
+
 def tonelli(n: int, p: int) -> int | None:
     """
     Solve for a square root r of n modulo p, i.e. find r such that r^2 = n (mod p).
@@ -110,21 +147,26 @@ def tonelli(n: int, p: int) -> int | None:
     # Special cases
     if p == 2:
         return n % 2
+    n %= p
     if n == 0:
         return 0
-    if not is_quadratic_residue(n, p):
-        return None
 
+    # There is no upfront residuosity test: every branch computes a candidate root
+    # anyway and notices a non-residue on the way, which saves a Legendre symbol.
     if p % 4 == 3:
-        return pow(n, (p + 1) // 4, p)
-
-    # Factor p-1 as q * 2^s with q odd.
-    q, s = decompose(p - 1)
-
-    # Find a quadratic non-residue z modulo p.
-    z = find_nonsquare(p)
+        r = pow(n, (p + 1) // 4, p)
+        return r if r * r % p == n else None
+    if p % 8 == 5:
+        # One exponentiation and a fix-up by sqrt(-1), e.g. for p = 2^255 - 19.
+        try:
+            r = sqrt_mod(n, p)
+        except ValueError:
+            return None
+        return min(r, p - r)
+
+    # Factor p-1 as q * 2^s with q odd, c = z^q for a quadratic non-residue z modulo p.
+    q, s, c = _tonelli_context(p)
 
-    c = pow(z, q, p)
     r = pow(n, (q + 1) // 2, p)
     t = pow(n, q, p)
     m = s
@@ -134,17 +176,21 @@ def tonelli(n: int, p: int) -> int | None:
         i = 0
         temp = t
         while temp != 1:
-            temp = pow(temp, 2, p)
+            temp = temp * temp % p
             i += 1
             if i == m:
-                raise ValueError("Algorithm error: t^(2^i) never reached 1")
+                # t has order 2^m, only possible if n is not a quadratic residue.
+                return None
 
-        # Compute b = c^(2^(m-i-1)) mod p.
-        b = pow(c, 1 << (m - i - 1), p)
+        # Compute b = c^(2^(m-i-1)) mod p by repeated squaring.
+        b = c
+        for _ in range(m - i - 1):
+            b = b * b % p
+        b2 = b * b % p
 
         r = (r * b) % p
-        t = (t * b * b) % p
-        c = (b * b) % p
+        t = (t * b2) % p
+        c = b2
         m = i
 
     return min(r, p - r)
@@ -27,8 +27,101 @@ def clamp_scalar(k: bytearray) -> int:
 
 
 def modinv(x: int, p: int) -> int:
-    """Modular inverse modulo p (p is prime)."""
-    return pow(x, p - 2, p)
+    """
+    Modular inverse modulo p (p is prime).
+
+    Uses the built-in (extended GCD based) inverse instead of x^(p-2). Like the Fermat
+    version, 0 is mapped to 0, which X25519 relies on for low-order inputs.
+    """
+    if x % p == 0:
+        return 0
+    return pow(x, -1, p)
+
+
+def batch_modinv(xs: list[int], p: int) -> list[int]:
+    """
+    Invert every element of xs modulo p with a single inversion (Montgomery's trick).
+
+    With prefix products c_i = x_0 * ... * x_i, inverting c_(n-1) once yields every
+    x_i^-1 by walking backwards, at 3 multiplications per element. Like modinv, zeros
+    are mapped to 0 (and left out of the products).
+    """
+    prefix = []
+    acc = 1
+    for x in xs:
+        prefix.append(acc)
+        if x % p:
+            acc = acc * x % p
+
+    inv = modinv(acc, p)
+    result = [0] * len(xs)
+    for i in reversed(range(len(xs))):
+        if xs[i] % p:
+            result[i] = inv * prefix[i] % p
+            inv = inv * xs[i] % p
+    return result
+
+
+# Window width of the signed-digit representation used for scalar multiplication.
+WNAF_WIDTH = 5
+
+
+def wnaf(scalar: int, width: int) -> list[int]:
+    """
+    Compute the width-w non-adjacent form of a non-negative scalar.
+
+    Returns the digits least-significant first. Every non-zero digit is odd and lies in
+    (-2^(w-1), 2^(w-1)), and any w consecutive digits contain at most one non-zero one.
+    Runs of zero digits are emitted at once, using the lowest set bit of the scalar.
+    """
+    digits = []
+    modulus = 1 << width
+    while scalar > 0:
+        zeros = (scalar & -scalar).bit_length() - 1
+        if zeros:
+            digits += [0] * zeros
+            scalar >>= zeros
+        digit = scalar & (modulus - 1)
+        if digit >= modulus // 2:
+            digit -= modulus
+        digits.append(digit)
+        scalar = (scalar - digit) >> 1
+    return digits
+
+
+P25519 = 2**255 - 19
+# sqrt(-1) modulo 2^255 - 19, used to fix up square roots.
+SQRT_M1_25519 = pow(2, (P25519 - 1) // 4, P25519)
+
+
+def _square_times(x: int, n: int, p: int) -> int:
+    """Compute x^(2^n) mod p by n successive squarings."""
+    for _ in range(n):
+        x = x * x % p
+    return x
+
+
+def pow_p58(z: int) -> int:
+    """
+    Compute z^((p-5)/8) = z^(2^252 - 3) modulo p = 2^255 - 19.
+
+    Uses the fixed addition chain from ref10 (252 squarings, 11 multiplications) in place
+    of the generic square-and-multiply of pow(), which also spends a multiplication on
+    nearly every one of the 252 one bits of the exponent.
+    """
+    p = P25519
+    z2 = z * z % p
+    z9 = _square_times(z2, 2, p) * z % p
+    z11 = z9 * z2 % p
+    z2_5_0 = z11 * z11 % p * z9 % p
+    z2_10_0 = _square_times(z2_5_0, 5, p) * z2_5_0 % p
+    z2_20_0 = _square_times(z2_10_0, 10, p) * z2_10_0 % p
+    z2_40_0 = _square_times(z2_20_0, 20, p) * z2_20_0 % p
+    z2_50_0 = _square_times(z2_40_0, 10, p) * z2_10_0 % p
+    z2_100_0 = _square_times(z2_50_0, 50, p) * z2_50_0 % p
+    z2_200_0 = _square_times(z2_100_0, 100, p) * z2_100_0 % p
+    z2_250_0 = _square_times(z2_200_0, 50, p) * z2_50_0 % p
+    return _square_times(z2_250_0, 2, p) * z % p
 
 
 def sqrt_mod(a: int, p: int) -> int:
@@ -44,12 +137,17 @@ def sqrt_mod(a: int, p: int) -> int:
     For general form, use Tonelli-Shanks
     """
 
-    exp = (p + 3) // 8
-    r = pow(a, exp, p)
-    if (r * r) % p == a % p:
-        return r
-    if (r * r) % p == (-a) % p:
+    if p == P25519:
+        # (p+3)/8 = (p-5)/8 + 1
+        r = pow_p58(a % p) * a % p
+        sqrt_m1 = SQRT_M1_25519
+    else:
+        r = pow(a, (p + 3) // 8, p)
         sqrt_m1 = pow(2, (p - 1) // 4, p)
+    r2 = r * r % p
+    if r2 == a % p:
+        return r
+    if r2 == (-a) % p:
         return (r * sqrt_m1) % p
     raise ValueError("No square root exists for the given input.")
 
@@ -60,9 +158,7 @@ def decode_u(u_bytes: bytes) -> int:
 
     (Mask off the high bit per RFC 7748.)
     """
-    u = bytearray(u_bytes)
-    u[31] &= 127
-    return int.from_bytes(u, "little")
+    return int.from_bytes(u_bytes, "little") & ((1 << 255) - 1)
 
 
 def encode_u_coordinate(x: int) -> bytes:
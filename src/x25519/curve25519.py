@@ -28,13 +28,48 @@ class Curve25519(Curve):  # type: ignore
         Steps:
           1. Clamp the 32-byte scalar (per RFC 7748).
           2. Decode the base points x-coordinate from u_bytes.
-          3. Run the optimized ladder to compute the scalar multiple.
+          3. Run the optimized ladder to compute the scalar multiple (see x25519_int).
           4. Encode the resulting x-coordinate as 32 bytes.
         """
         k_int = clamp_scalar(bytearray(k_bytes))
-        xP = decode_u(u_bytes)
+        return encode_u_coordinate(self.x25519_int(k_int, decode_u(u_bytes)))
+
+    def x25519_int(self, k_int: int, xP: int) -> int:
+        """
+        X25519 on integers: k_int must already be clamped and xP already decoded.
+
+        Callers that reuse the same private key can clamp it once and call this directly.
+        """
         point = self.recover_point(xP)  # Will be (Xp, 0) for Montgomery ladder
         result = self.scalar_mult(point, k_int)
         if result is IdentityPoint:
             raise ValueError("Resulting point is the point at infinity")
-        return encode_u_coordinate(result.x)  # type: ignore
+        return result.x  # type: ignore
+
+    def x25519_batch(self, scalars: list[bytes], u_points: list[bytes]) -> list[bytes]:
+        """Compute X25519(scalars[i], u_points[i]) for every i."""
+        k_ints = [clamp_scalar(bytearray(k_bytes)) for k_bytes in scalars]
+        xPs = [decode_u(u_bytes) for u_bytes in u_points]
+        return [encode_u_coordinate(x) for x in self.x25519_int_batch(k_ints, xPs)]
+
+    def x25519_int_batch(self, k_ints: list[int], xPs: list[int]) -> list[int]:
+        """
+        Batch version of x25519_int.
+
+        Computes every pair on its own, sub-classes that can share work across the batch
+        override this.
+        """
+        return [self.x25519_int(k, xP) for k, xP in zip(k_ints, xPs, strict=True)]
+
+    def x25519_base(self, k_bytes: bytes) -> bytes:
+        """Compute X25519(k, 9), i.e. the public key for the private key k_bytes."""
+        return encode_u_coordinate(self.x25519_base_int(clamp_scalar(bytearray(k_bytes))))
+
+    def x25519_base_int(self, k_int: int) -> int:
+        """
+        Compute X25519(k, 9) for an already clamped scalar.
+
+        Runs this curve's own scalar_mult on the base point, sub-classes with a faster
+        fixed-base method override this.
+        """
+        return self.x25519_int(k_int, self.B.x)  # type: ignore
@@ -1,6 +1,6 @@
 from diffie_hellman import DiffieHellman
 from keys import PrivateKey, PublicKey, SharedKey
-from util import encode_u_coordinate
+from util import clamp_scalar, decode_u, encode_u_coordinate
 from x25519.curve25519 import Curve25519
 from x25519.montgomery_ladder import MontgomeryLadderRFC7748
 
@@ -27,6 +27,8 @@ class EllipticCurveDiffieHellman(DiffieHellman):  # type: ignore
         """
         super().__init__(private_key)
         self.curve = curve if curve is not None else MontgomeryLadderRFC7748()
+        # Clamp the private key once, both directions below reuse the integer scalar.
+        self._scalar = clamp_scalar(bytearray(private_key.get_key()))
         self.public_key = self.compute_public_key()
 
     def compute_public_key(self) -> PublicKey:
@@ -34,16 +36,14 @@ class EllipticCurveDiffieHellman(DiffieHellman):  # type: ignore
         Computes the public key corresponding to the private key.
 
         For X25519 the standard base point is defined as 9, represented as 0x09
-        followed by 31 zero bytes (little-endian).
+        followed by 31 zero bytes (little-endian). This goes through the curve's
+        x25519_base_int, which the RFC 7748 ladder (the default curve) overrides with
+        a fixed-base comb, other curves run their own scalar_mult.
 
         Returns:
             PublicKey: The 32-byte public key.
         """
-        return PublicKey(
-            self.curve.x25519(
-                self.private_key.get_key(), encode_u_coordinate(self.curve.B.x)
-            )
-        )
+        return PublicKey(encode_u_coordinate(self.curve.x25519_base_int(self._scalar)))
 
     def generate_shared_secret(self, peer_public_key: PublicKey) -> SharedKey:
         """
@@ -55,6 +55,20 @@ class EllipticCurveDiffieHellman(DiffieHellman):  # type: ignore
         Returns:
             SharedKey: The computed 32-byte shared secret.
         """
-        return SharedKey(
-            self.curve.x25519(self.private_key.get_key(), peer_public_key.get_key())
-        )
+        xP = decode_u(peer_public_key.get_key())
+        return SharedKey(encode_u_coordinate(self.curve.x25519_int(self._scalar, xP)))
+
+    def generate_shared_secrets(
+        self, peer_public_keys: list[PublicKey]
+    ) -> list[SharedKey]:
+        """
+        Computes the shared secrets with several peers at once.
+
+        Curves that support it share work across the batch, e.g. the RFC 7748 ladder
+        inverts all results together.
+        """
+        xPs = [
+            decode_u(peer_public_key.get_key()) for peer_public_key in peer_public_keys
+        ]
+        results = self.curve.x25519_int_batch([self._scalar] * len(xPs), xPs)
+        return [SharedKey(encode_u_coordinate(x)) for x in results]
@@ -1,15 +1,41 @@
+from functools import lru_cache
 from typing import override
 
 from curve import AffinePoint, DoubleAndAddCurve, IdentityPoint, Point
-from tonelli import tonelli
-from util import modinv
+from util import WNAF_WIDTH, modinv, sqrt_mod, wnaf
 from x25519.curve25519 import Curve25519
 
+# Homogeneous projective coordinates (X, Y, Z) with x = X/Z and y = Y/Z.
+ProjectiveCoordinates = tuple[int, int, int]
+
+# The point at infinity in projective coordinates.
+_INFINITY: ProjectiveCoordinates = (0, 1, 0)
+
+
+@lru_cache(maxsize=1024)
+def _recover_y(x: int, A: int, p: int) -> int:
+    """The y-coordinate recover_point returns for x, a square root of the RHS."""
+    # Horner form x*(x*(x + A) + 1), plain products are cheaper than pow for these
+    # small exponents.
+    rhs = ((x + A) * x + 1) * x % p
+    # p = 5 (mod 8), so sqrt_mod needs no Tonelli-Shanks iterations.
+    try:
+        y = sqrt_mod(rhs, p)
+    except ValueError:
+        raise ValueError("No valid y for given x") from None
+
+    # Choose the larger of y and p - y (RFC 7748 erratum base point). For odd p,
+    # y < p - y is y <= p // 2, no subtraction needed. y = 0 is its own negative.
+    if 0 < y <= p >> 1:
+        y = p - y
+    return y
+
 
 class Curve25519GroupLaw(Curve25519, DoubleAndAddCurve):  # type: ignore
     def __init__(self) -> None:
         super().__init__()
         self.A = 486662
+        self._B_lookup = self._projective_lookup((self.B.x, self.B.y, 1))  # type: ignore
 
     @override  # type: ignore
     def recover_point(self, x: int) -> Point:
@@ -18,16 +44,10 @@ class Curve25519GroupLaw(Curve25519, DoubleAndAddCurve):  # type: ignore
 
         y**2 = x**3 + A*x**2 + x   (mod p) by computing a square root of the RHS.
         If there is no square root, raise a ValueError.
-        """
-        rhs = (pow(x, 3, self.p) + self.A * pow(x, 2, self.p) + x) % self.p
-        y = tonelli(rhs, self.p)
-        if y is None:
-            raise ValueError("No valid y for given x")
 
-        # Choose the smaller square root, but should be the same
-        if y < self.p - y:
-            y = self.p - y
-        return AffinePoint(x, y)
+        Public keys tend to repeat, so y is memoized per x (see _recover_y).
+        """
+        return AffinePoint(x, _recover_y(x, self.A, self.p))
 
     @override  # type: ignore
     def add(self, P: Point, Q: Point) -> Point:
@@ -42,22 +62,26 @@ class Curve25519GroupLaw(Curve25519, DoubleAndAddCurve):  # type: ignore
         If P == Q then doubling is performed.
         Returns the resulting point, or None if the result is the point at infinity.
         """
-        if P is IdentityPoint or Q is IdentityPoint:
-            return Q if P is IdentityPoint else P
+        if P is IdentityPoint:
+            return Q
+        if Q is IdentityPoint:
+            return P
 
-        x1, y1 = P.x, P.y
-        x2, y2 = Q.x, Q.y
+        x1, y1, x2, y2 = P.x, P.y, Q.x, Q.y
+        p = self.p
+        A = self.A
 
         if x1 == x2:
-            # If y1 + y2 = 0 mod p, then Q is the inverse of P.
-            if (y1 + y2) % self.p == 0:
+            # Then y1 = y2 or y1 = -y2 (coordinates are reduced). If they differ, Q is
+            # the inverse of P.
+            if y1 != y2:
                 return IdentityPoint
-            # Otherwise, P == Q and we perform doubling.
+            # Otherwise, P == Q and we perform doubling (which handles y = 0).
             return self.double(P)
 
-        lam = ((y2 - y1) * modinv(x2 - x1, self.p)) % self.p
-        x3 = (lam * lam - self.A - x1 - x2) % self.p
-        y3 = (lam * (x1 - x3) - y1) % self.p
+        lam = ((y2 - y1) * modinv(x2 - x1, p)) % p
+        x3 = (lam * lam - A - x1 - x2) % p
+        y3 = (lam * (x1 - x3) - y1) % p
 
         return AffinePoint(x3, y3)
 
@@ -77,9 +101,106 @@ class Curve25519GroupLaw(Curve25519, DoubleAndAddCurve):  # type: ignore
         x, y = P.x, P.y
         if y == 0:
             return IdentityPoint
+        p = self.p
+        A = self.A
 
-        lam = ((3 * x * x + 2 * self.A * x + 1) * modinv(2 * y, self.p)) % self.p
-        x3 = (lam * lam - self.A - 2 * x) % self.p
-        y3 = (lam * (x - x3) - y) % self.p
+        lam = ((3 * x * x + 2 * A * x + 1) * modinv(2 * y, p)) % p
+        x3 = (lam * lam - A - 2 * x) % p
+        y3 = (lam * (x - x3) - y) % p
 
         return AffinePoint(x3, y3)
+
+    @override
+    def scalar_mult(self, R: Point, scalar: int) -> Point:
+        """
+        Signed-window (wNAF) scalar multiplication in homogeneous projective coordinates.
+
+        The affine add and double pay one modular inversion each, the projective
+        formulas below pay none, so only the final conversion back to affine inverts.
+        The table of odd multiples is kept for the base point and computed on the fly
+        for any other point.
+        """
+        if R is IdentityPoint or scalar <= 0:
+            return IdentityPoint
+
+        if R == self.B:
+            lookup = self._B_lookup
+        else:
+            lookup = self._projective_lookup((R.x, R.y, 1))
+        add = self._projective_add
+        double = self._projective_double
+
+        Q = _INFINITY
+        for digit in reversed(wnaf(scalar, WNAF_WIDTH)):
+            Q = double(Q)
+            if digit:
+                Q = add(Q, lookup[digit // 2])
+
+        X, Y, Z = Q
+        if Z == 0:
+            return IdentityPoint
+        z_inv = modinv(Z, self.p)
+        return AffinePoint(X * z_inv % self.p, Y * z_inv % self.p)
+
+    def _projective_lookup(self, P: ProjectiveCoordinates) -> list[ProjectiveCoordinates]:
+        """
+        Return [P, 3P, ..., 15P] followed by the negated entries in reverse order.
+
+        Then lookup[digit // 2] is digit * P for positive and negative odd digits alike
+        (the layout of EdwardsCurve._signed_lookup). Negation only flips the sign of Y.
+        """
+        P2 = self._projective_double(P)
+        table = [P]
+        for _ in range(2 ** (WNAF_WIDTH - 2) - 1):
+            table.append(self._projective_add(table[-1], P2))
+        return table + [(X, -Y % self.p, Z) for X, Y, Z in reversed(table)]
+
+    def _projective_add(
+        self, P: ProjectiveCoordinates, Q: ProjectiveCoordinates
+    ) -> ProjectiveCoordinates:
+        """
+        Add two points in projective coordinates, the chord formulas of add with the
+        denominators of lambda = u / v collected in Z3 = v^3 * Z1 * Z2.
+        """
+        X1, Y1, Z1 = P
+        X2, Y2, Z2 = Q
+        if Z1 == 0:
+            return Q
+        if Z2 == 0:
+            return P
+        p = self.p
+
+        u = (Y2 * Z1 - Y1 * Z2) % p
+        v = (X2 * Z1 - X1 * Z2) % p
+        if v == 0:
+            # Same x-coordinate: either Q = P or Q = -P.
+            return self._projective_double(P) if u == 0 else _INFINITY
+
+        vv = v * v % p
+        vvv = vv * v % p
+        Z1Z2 = Z1 * Z2 % p
+        w = (u * u * Z1Z2 - vv * (self.A * Z1Z2 + X1 * Z2 + X2 * Z1)) % p
+        X3 = v * w % p
+        Y3 = (u * (X1 * vv * Z2 - w) - Y1 * vvv * Z2) % p
+        Z3 = vvv * Z1Z2 % p
+        return X3, Y3, Z3
+
+    def _projective_double(self, P: ProjectiveCoordinates) -> ProjectiveCoordinates:
+        """
+        Double a point in projective coordinates, the tangent formulas of double with
+        lambda = n / d for n = 3X^2 + 2AXZ + Z^2 and d = 2YZ, and Z3 = d^3 * Z.
+        """
+        X, Y, Z = P
+        if Y == 0 or Z == 0:
+            return _INFINITY
+        p = self.p
+
+        n = (3 * X * X + 2 * self.A * X * Z + Z * Z) % p
+        d = 2 * Y * Z % p
+        dd = d * d % p
+        ddd = dd * d % p
+        w = (n * n * Z - dd * (self.A * Z + 2 * X)) % p
+        X3 = d * w % p
+        Y3 = (n * (X * dd - w) - Y * ddd) % p
+        Z3 = ddd * Z % p
+        return X3, Y3, Z3
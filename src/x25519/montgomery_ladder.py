@@ -1,8 +1,71 @@
+from functools import cache
+from typing import override
+
 from curve import AffinePoint, Point
-from util import cswap, modinv, projective_to_affine
+from ed25519.extended_edwards_curve import ExtendedEdwardsCurve
+from util import batch_modinv, cswap, modinv, projective_to_affine
 from x25519.curve25519 import Curve25519
 
 
+@cache
+def _edwards25519() -> ExtendedEdwardsCurve:
+    """The birationally equivalent Edwards curve, its comb table is built on first use."""
+    return ExtendedEdwardsCurve()
+
+
+def xdbladd(
+    x2: int, z2: int, x3: int, z3: int, x1: int, a24: int, p: int
+) -> tuple[int, int, int, int]:
+    """
+    One combined doubling and differential addition step of the ladder.
+
+    Given (x2 : z2) = P, (x3 : z3) = Q and x1 = x(Q - P), return 2P and P + Q. Costs
+    5M + 4S + 1C and no inversion, the shared sums and differences are computed once.
+    They only feed into multiplications, so they are left unreduced.
+    """
+    A = x2 + z2
+    AA = A * A % p
+    B = x2 - z2
+    BB = B * B % p
+    E = AA - BB
+    C = x3 + z3
+    D = x3 - z3
+    DA = D * A % p
+    CB = C * B % p
+    X3 = DA + CB
+    Z3 = DA - CB
+    return AA * BB % p, E * (AA + a24 * E) % p, X3 * X3 % p, x1 * (Z3 * Z3 % p) % p
+
+
+def ladder(u_int: int, scalar: int, p: int, a24: int) -> tuple[int, int]:
+    """
+    Run the RFC 7748 ladder and return the projective result (x2 : z2), not inverted.
+
+    A plain function of its arguments, so the loop only touches locals.
+    """
+    x1 = u_int
+    x2, z2 = 1, 0
+    x3, z3 = u_int, 1
+    swap = 0
+
+    # Loop over bits of k from top (254) down to 0
+    # (Note the top bit is always set after clamping, so we skip bit 255)
+    # The bits are read off a binary string once instead of shifting k per bit.
+    for k_t in map(int, format(scalar & ((1 << 255) - 1), "0255b")):
+        # Swap arithmetically instead of branching on the secret bit.
+        swap ^= k_t
+        x2, x3 = cswap(swap, x2, x3, p)
+        z2, z3 = cswap(swap, z2, z3, p)
+        swap = k_t
+
+        x2, z2, x3, z3 = xdbladd(x2, z2, x3, z3, x1, a24, p)
+
+    # Last swap if needed
+    x2, x3 = cswap(swap, x2, x3, p)
+    z2, z3 = cswap(swap, z2, z3, p)
+    return x2, z2
+
+
 class MontgomeryLadderRFC7748(Curve25519):  # type: ignore
     def scalar_mult(self, R: Point, scalar: int) -> Point:
         """
@@ -12,95 +75,85 @@ class MontgomeryLadderRFC7748(Curve25519):  # type: ignore
 
         Follows the pseudo-code in RFC 7748, section 5.
         """
-        u_int = R.x
-
-        x1 = u_int
-        x2, z2 = 1, 0
-        x3, z3 = u_int, 1
-        swap = 0
-
-        # Loop over bits of k from top (254) down to 0
-        # (Note the top bit is always set after clamping, so we skip bit 255)
-        for t in reversed(range(255)):
-            k_t = (scalar >> t) & 1
-            if k_t != swap:
-                x2, x3 = x3, x2
-                z2, z3 = z3, z2
-                swap = k_t
-
-            # The curve arithmetic
-            #  -- all operations mod P
-            A = (x2 + z2) % self.p
-            B = (x2 - z2) % self.p
-            AA = (A * A) % self.p
-            BB = (B * B) % self.p
-            E = (AA - BB) % self.p
-            C = (x3 + z3) % self.p
-            D = (x3 - z3) % self.p
-            DA = (D * A) % self.p
-            CB = (C * B) % self.p
-            x3 = (DA + CB) % self.p
-            x3 = (x3 * x3) % self.p
-            z3 = (DA - CB) % self.p
-            z3 = (z3 * z3) % self.p
-            z3 = (z3 * x1) % self.p
-            x2 = (AA * BB) % self.p
-            z2 = (E * ((AA + (self.a24 * E) % self.p) % self.p)) % self.p
-
-        # Last swap if needed
-        if swap:
-            x2, x3 = x3, x2
-            z2, z3 = z3, z2
-
-        # Return x2 * (z2^(p-2)) mod p  (the u-coordinate)
-        # We use Fermat's little theorem for the inverse: z2^(p-2) mod p
-        # inv_z2 = pow(z2, P - 2, P)
+        x2, z2 = ladder(R.x, scalar, self.p, self.a24)
+        # Return x2 / z2 mod p (the u-coordinate), z2 = 0 maps to 0 as in RFC 7748
         inv_z2: int = modinv(z2, self.p)
         x = (x2 * inv_z2) % self.p
         return AffinePoint(x, 0)  # We only care about the x-coordinate
 
+    @override
+    def x25519_int_batch(self, k_ints: list[int], xPs: list[int]) -> list[int]:
+        """
+        Run one ladder per pair and share the final inversion (Montgomery's trick).
+
+        The projective results (x2 : z2) are only normalised at the end, with a single
+        inversion for all of them instead of one per ladder.
+        """
+        p = self.p
+        a24 = self.a24
+        results = [ladder(xP, k, p, a24) for k, xP in zip(k_ints, xPs, strict=True)]
+        inverses = batch_modinv([z2 for _, z2 in results], p)
+        return [x2 * inv % p for (x2, _), inv in zip(results, inverses, strict=True)]
+
+    @override
+    def x25519_base_int(self, k_int: int) -> int:
+        """
+        Compute X25519(k, 9) for an already clamped scalar.
+
+        The base point is fixed, so instead of the variable-base ladder this uses the
+        precomputed comb table of the Ed25519 base point, which maps to u = 9 under the
+        birational map u = (1 + y) / (1 - y).
+        """
+        return _edwards25519().montgomery_u_fixed_base(k_int)
+
 
 class MontgomeryLadderMKTutorial(Curve25519):  # type: ignore
     def ladder_step(
-        self, a: int, b: int, c: int, d: int, Rx: int
+        self, a: int, b: int, c: int, d: int, Rx: int, p: int, a24: int
     ) -> tuple[int, int, int, int]:
-        """Perform one step of the Montgomery ladder."""
+        """
+        Perform one step of the Montgomery ladder.
+
+        Sums and differences only feed into multiplications, which reduce mod p, so
+        they are left unreduced. The modulus p and a24 are passed in by the caller,
+        so the step does not look them up on self.
+        """
         # v1 = a + c
-        e = a + c % self.p
+        e = a + c
         # v2 = a - c
-        a = a - c % self.p
+        a = a - c
         # v3 = b + d
-        c = b + d % self.p
+        c = b + d
         # v4 = b - d
-        b = b - d % self.p
+        b = b - d
         # v5 = (v1)^2 = (a+c)^2
-        d = e * e % self.p
+        d = e * e % p
         # v6 = (v2)^2 = (a-c)^2
-        f_val = a * a % self.p
+        f_val = a * a % p
         # v7 = (b + d)* (a - c)
-        a = c * a % self.p
+        a = c * a % p
         # v8 = (b - d) * (a + c)
-        c = b * e % self.p
+        c = b * e % p
         # v9 = v7 + v8
-        e = a + c % self.p
+        e = a + c
         # v10 = v7 - v8
-        a = a - c % self.p
+        a = a - c
         # v11 = (v10)^2
-        b = a * a % self.p
+        b = a * a % p
         # v12 = v5 - v6
-        c = d - f_val % self.p
+        c = d - f_val
         # v13 = 121665 * v12
-        a = c * self.a24 % self.p
+        a = c * a24 % p
         # v14 = v13 + v5
-        a = a + d % self.p
+        a = a + d
         # v15 = v12 * v14
-        c = c * a % self.p
+        c = c * a % p
         # v16 = v5 * v6
-        a = d * f_val % self.p
+        a = d * f_val % p
         # v17 = v11 * xP
-        d = b * Rx % self.p
+        d = b * Rx % p
         # v18 = (v9)^2
-        b = e * e % self.p
+        b = e * e % p
 
         return a, b, c, d
 
@@ -121,6 +174,11 @@ class MontgomeryLadderMKTutorial(Curve25519):  # type: ignore
 
         Finally, return the affine x-coordinate as a * inv(c) mod P.
         """
+        p = self.p
+        a24 = self.a24
+        step = self.ladder_step
+        Rx = R.x
+
         # Initialize state
         a = 1
         b = R.x
@@ -128,18 +186,16 @@ class MontgomeryLadderMKTutorial(Curve25519):  # type: ignore
         d = 1
 
         # Process bits 254 down to 0
-        for i in range(254, -1, -1):
-            bit = (scalar >> i) & 1
-
+        for bit in [(scalar >> i) & 1 for i in range(254, -1, -1)]:
             # --- Pre-step swap (if bit==1) ---
-            a, b = cswap(bit, a, b, self.p)
-            c, d = cswap(bit, c, d, self.p)
+            a, b = cswap(bit, a, b, p)
+            c, d = cswap(bit, c, d, p)
 
-            a, b, c, d = self.ladder_step(a, b, c, d, R.x)
+            a, b, c, d = step(a, b, c, d, Rx, p, a24)
 
             # --- Final swap (if bit==1) ---
-            a, b = cswap(bit, a, b, self.p)
-            c, d = cswap(bit, c, d, self.p)
+            a, b = cswap(bit, a, b, p)
+            c, d = cswap(bit, c, d, p)
 
         # After the loop, a and c are the numerator and denominator.
-        return AffinePoint(projective_to_affine(a, c, self.p), 0)
+        return AffinePoint(projective_to_affine(a, c, p), 0)
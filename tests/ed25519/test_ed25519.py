@@ -7,7 +7,7 @@ from parameterized import parameterized
 
 from ed25519.affine_edwards_curve import AffineEdwardsCurve
 from ed25519.edwards_curve import EdwardsCurve
-from ed25519.edwards_signature_scheme import Ed25519
+from ed25519.edwards_signature_scheme import Ed25519, _half_size_pair
 from ed25519.extended_edwards_curve import ExtendedEdwardsCurve
 from keys import PrivateKey
 
@@ -146,6 +146,50 @@ class TestEd25519Implementation(unittest.TestCase):
             f"Custom verification accepted an altered signature with {curve_name}.",
         )
 
+    @parameterized.expand(
+        [
+            (AffineEdwardsCurve(), "AffineEdwardsCurve"),
+            (ExtendedEdwardsCurve(), "ExtendedEdwardsCurve"),
+        ]
+    )  # type: ignore
+    def test_zero_response_rejected(self, curve: EdwardsCurve, curve_name: str) -> None:
+        # [0]B is the neutral element, it must not compare equal to R + [k]A.
+        _, _, custom_signer = self.generate_keys(curve)
+        msg = b"Test message for a forged signature"
+        forged_signature = curve.compress(curve.B) + bytes(32)
+
+        self.assertFalse(
+            custom_signer.verify(forged_signature, msg, custom_signer.public_key),
+            f"Custom verification accepted t = 0 with {curve_name}.",
+        )
+
+    @parameterized.expand(
+        [
+            (AffineEdwardsCurve(), "AffineEdwardsCurve"),
+            (ExtendedEdwardsCurve(), "ExtendedEdwardsCurve"),
+        ]
+    )  # type: ignore
+    def test_non_canonical_response_rejected(
+        self, curve: EdwardsCurve, curve_name: str
+    ) -> None:
+        # t + q satisfies the group equation as well, but is not a canonical encoding.
+        _, _, custom_signer = self.generate_keys(curve)
+        msg = b"Test message for a malleated signature"
+        signature = custom_signer.sign(msg)
+        t_int = int.from_bytes(signature[32:], "little") + curve.q
+        malleated_signature = signature[:32] + t_int.to_bytes(32, "little")
+
+        self.assertFalse(
+            custom_signer.verify(malleated_signature, msg, custom_signer.public_key),
+            f"Custom verification accepted t + q with {curve_name}.",
+        )
+        self.assertFalse(
+            custom_signer.batch_verify(
+                [(malleated_signature, msg, custom_signer.public_key)]
+            ),
+            f"Batch verification accepted t + q with {curve_name}.",
+        )
+
     @parameterized.expand(
         [
             (AffineEdwardsCurve(), "AffineEdwardsCurve"),
@@ -198,6 +242,109 @@ class TestEd25519Implementation(unittest.TestCase):
             f"Custom verification failed for a large message with {curve_name}.",
         )
 
+    @parameterized.expand(
+        [
+            (AffineEdwardsCurve(), "AffineEdwardsCurve"),
+            (ExtendedEdwardsCurve(), "ExtendedEdwardsCurve"),
+        ]
+    )  # type: ignore
+    def test_batch_verify(self, curve: EdwardsCurve, curve_name: str) -> None:
+        signers = [self.generate_keys(curve)[2] for _ in range(2)]
+        items = []
+        for i in range(6):
+            signer = signers[i % 2]
+            msg = secrets.token_bytes(secrets.randbelow(129))
+            items.append((signer.sign(msg), msg, signer.public_key))
+
+        self.assertTrue(
+            signers[0].batch_verify(items),
+            f"Batch verification rejected valid signatures with {curve_name}.",
+        )
+        self.assertTrue(signers[0].batch_verify([]))
+
+        altered_signature = bytearray(items[3][0])
+        altered_signature[40] ^= 0x01
+        altered = list(items)
+        altered[3] = (bytes(altered_signature), items[3][1], items[3][2])
+        self.assertFalse(
+            signers[0].batch_verify(altered),
+            f"Batch verification accepted an altered signature with {curve_name}.",
+        )
+
+        swapped = list(items)
+        swapped[0] = (items[0][0], items[0][1], signers[1].public_key)
+        self.assertFalse(
+            signers[0].batch_verify(swapped),
+            f"Batch verification accepted a wrong public key with {curve_name}.",
+        )
+
+    def test_half_size_pair(self) -> None:
+        q = ExtendedEdwardsCurve().q
+        for k in [0, 1, q - 1, secrets.randbelow(q)]:
+            c0, c1 = _half_size_pair(k, q)
+            self.assertEqual(c0 % q, k * c1 % q)
+            self.assertNotEqual(c1, 0)
+            self.assertLess(max(abs(c0), abs(c1)), 2**127)
+
+    def test_native_matches_pure_python(self) -> None:
+        seed = secrets.token_bytes(32)
+        pure_signer = Ed25519(secret_key=PrivateKey(seed))
+        native_signer = Ed25519(secret_key=PrivateKey(seed), use_native=True)
+        self.assertEqual(pure_signer.public_key, native_signer.public_key)
+
+        msg = b"Attack at Dawn"
+        signature = native_signer.sign(msg)
+        self.assertEqual(signature, pure_signer.sign(msg))
+        self.assertTrue(native_signer.verify(signature, msg, pure_signer.public_key))
+
+        altered_signature = bytearray(signature)
+        altered_signature[0] ^= 0x01
+        self.assertFalse(
+            native_signer.verify(bytes(altered_signature), msg, pure_signer.public_key)
+        )
+
+    def test_batch_verify_native(self) -> None:
+        signer = Ed25519(secret_key=PrivateKey(), use_native=True)
+        msgs = [secrets.token_bytes(16) for _ in range(3)]
+        items = [(signer.sign(msg), msg, signer.public_key) for msg in msgs]
+        self.assertTrue(signer.batch_verify(items))
+
+        altered_signature = bytearray(items[1][0])
+        altered_signature[40] ^= 0x01
+        items[1] = (bytes(altered_signature), items[1][1], items[1][2])
+        self.assertFalse(signer.batch_verify(items))
+
+    def test_small_order_component_cofactored(self) -> None:
+        """
+        The pure-Python verify is cofactored, libsodium is cofactorless: adding a point
+        of order 8 to R yields a signature only the pure-Python check accepts.
+        """
+        curve = ExtendedEdwardsCurve()
+        seed = secrets.token_bytes(32)
+        pure_signer = Ed25519(secret_key=PrivateKey(seed), curve=curve)
+        native_signer = Ed25519(secret_key=PrivateKey(seed), use_native=True)
+        pk = pure_signer.public_key
+
+        T = curve.uncompress(
+            bytes.fromhex(
+                "c7176a703d4dd84fba3c0b760d10670f2a2053fa2c39ccc64ec7fd7792ac037a"
+            )
+        )
+        # T has order 8: [8]T is the neutral element (0, 1), [4]T is not.
+        neutral = (1).to_bytes(32, "little")
+        self.assertEqual(curve.compress(curve.scalar_mult(T, 8)), neutral)
+        self.assertNotEqual(curve.compress(curve.scalar_mult(T, 4)), neutral)
+
+        msg = b"Attack at Dawn"
+        r = secrets.randbelow(curve.q)
+        R_comp = curve.compress(curve.add(curve.scalar_mult_fixed_base(r), T))
+        k = pure_signer._challenge(R_comp, pk.get_key(), msg)
+        t = (r + k * pure_signer.s_int) % curve.q
+        signature = R_comp + t.to_bytes(32, "little")
+
+        self.assertTrue(pure_signer.verify(signature, msg, pk))
+        self.assertFalse(native_signer.verify(signature, msg, pk))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,3 +1,4 @@
+import secrets
 import unittest
 
 from parameterized import parameterized
@@ -65,6 +66,21 @@ class TestEdwardsCurveOperations(unittest.TestCase):
         ):
             _ = curve.uncompress(invalid_bytes)
 
+    @parameterized.expand(
+        [
+            (AffineEdwardsCurve(), "AffineEdwardsCurve"),
+            (ExtendedEdwardsCurve(), "ExtendedEdwardsCurve"),
+        ]
+    )  # type: ignore
+    def test_uncompress_not_on_curve(self, curve, curve_name) -> None:
+        """Test that a y-coordinate without a matching x raises a ValueError."""
+        # (y^2 - 1) / (d*y^2 + 1) is not a square for y = 2.
+        with self.assertRaises(
+            ValueError,
+            msg=f"Uncompressing a point not on the curve did not raise for {curve_name}",
+        ):
+            _ = curve.uncompress((2).to_bytes(32, "little"))
+
     @parameterized.expand(
         [
             (AffineEdwardsCurve(), "AffineEdwardsCurve"),
@@ -74,22 +90,44 @@ class TestEdwardsCurveOperations(unittest.TestCase):
     def test_point_equals_identity(self, curve, curve_name) -> None:
         """
         Test that the point_equals method treats IdentityPoint correctly.
-        (Note: per our implementation, if either point is IdentityPoint,
-         point_equals returns True.)
+        IdentityPoint stands for the neutral element (0, 1): it equals itself and
+        (0, 1), but no other point (else verify would accept forged signatures).
         """
         P = curve.B
-        self.assertTrue(
+        self.assertFalse(
             curve.point_equals(P, IdentityPoint),
-            f"Point equality with IdentityPoint failed for {curve_name}",
+            f"IdentityPoint equal to the base point for {curve_name}",
         )
-        self.assertTrue(
+        self.assertFalse(
             curve.point_equals(IdentityPoint, P),
-            f"Point equality with IdentityPoint failed for {curve_name}",
+            f"IdentityPoint equal to the base point for {curve_name}",
         )
         self.assertTrue(
             curve.point_equals(IdentityPoint, IdentityPoint),
             f"IdentityPoint not equal to itself for {curve_name}",
         )
+        self.assertTrue(
+            curve.point_equals(IdentityPoint, curve.scalar_mult(P, curve.q)),
+            f"IdentityPoint not equal to q * B for {curve_name}",
+        )
+
+    @parameterized.expand(
+        [
+            (AffineEdwardsCurve(), "AffineEdwardsCurve"),
+            (ExtendedEdwardsCurve(), "ExtendedEdwardsCurve"),
+        ]
+    )  # type: ignore
+    def test_point_equals_distinct(self, curve, curve_name) -> None:
+        """Test that point_equals tells distinct points apart."""
+        P = curve.B
+        Q = curve.double(P)
+        self.assertFalse(
+            curve.point_equals(P, Q), f"B and 2B compare equal for {curve_name}"
+        )
+        self.assertTrue(
+            curve.point_equals(Q, curve.add(P, P)),
+            f"2B and B + B compare unequal for {curve_name}",
+        )
 
     @parameterized.expand(
         [
@@ -166,6 +204,114 @@ class TestEdwardsCurveOperations(unittest.TestCase):
             f"Doubling and adding a point to itself are not consistent for {curve_name}",
         )
 
+    @parameterized.expand(
+        [
+            (AffineEdwardsCurve(), "AffineEdwardsCurve"),
+            (ExtendedEdwardsCurve(), "ExtendedEdwardsCurve"),
+        ]
+    )  # type: ignore
+    def test_scalar_mult_fixed_base(self, curve, curve_name) -> None:
+        """Test that the precomputed base point table agrees with scalar_mult."""
+        for k in [
+            1,
+            2,
+            8,
+            15,
+            16,
+            17,
+            curve.q - 1,
+            curve.q + 8,
+            2**256 - 1,
+            secrets.randbelow(curve.q),
+        ]:
+            self.assertTrue(
+                curve.point_equals(
+                    curve.scalar_mult_fixed_base(k), curve.scalar_mult(curve.B, k)
+                ),
+                f"Fixed-base scalar multiplication by {k} is wrong for {curve_name}",
+            )
+
+    @parameterized.expand(
+        [
+            (AffineEdwardsCurve(), "AffineEdwardsCurve"),
+            (ExtendedEdwardsCurve(), "ExtendedEdwardsCurve"),
+        ]
+    )  # type: ignore
+    def test_montgomery_u_fixed_base(self, curve, curve_name) -> None:
+        """Test that B maps to u = 9, k * B to u = (1 + y) / (1 - y), 0 * B to 0."""
+        p = curve.p
+        self.assertEqual(curve.montgomery_u_fixed_base(1), 9)
+        self.assertEqual(curve.montgomery_u_fixed_base(0), 0)
+        k = secrets.randbelow(curve.q)
+        # The compressed encoding is y with the sign of x in the top bit.
+        encoded = curve.compress(curve.scalar_mult(curve.B, k))
+        y = int.from_bytes(encoded, "little") & ((1 << 255) - 1)
+        self.assertEqual(
+            curve.montgomery_u_fixed_base(k),
+            (1 + y) * pow(1 - y, -1, p) % p,
+            f"Montgomery u-coordinate of {k} * B is wrong for {curve_name}",
+        )
+
+    @parameterized.expand(
+        [
+            (AffineEdwardsCurve(), "AffineEdwardsCurve"),
+            (ExtendedEdwardsCurve(), "ExtendedEdwardsCurve"),
+        ]
+    )  # type: ignore
+    def test_scalar_mult_neutral_element(self, curve, curve_name) -> None:
+        """Test that 0 * B and q * B give the neutral element (0, 1)."""
+        neutral = (1).to_bytes(32, "little")
+        for result in [
+            curve.scalar_mult_fixed_base(0),
+            curve.scalar_mult(curve.B, 0),
+            curve.scalar_mult(curve.B, curve.q),
+        ]:
+            self.assertEqual(
+                curve.compress(result),
+                neutral,
+                f"Multiplying by a multiple of q is not (0, 1) for {curve_name}",
+            )
+
+    @parameterized.expand(
+        [
+            (AffineEdwardsCurve(), "AffineEdwardsCurve"),
+            (ExtendedEdwardsCurve(), "ExtendedEdwardsCurve"),
+        ]
+    )  # type: ignore
+    def test_identity_is_neutral(self, curve, curve_name) -> None:
+        """Test that the neutral element as a regular point needs no special case."""
+        P = curve.scalar_mult(curve.B, 5)
+        neutral = curve.scalar_mult(curve.B, curve.q)
+        for result in [curve.add(P, neutral), curve.add(neutral, P)]:
+            self.assertEqual(
+                curve.compress(result),
+                curve.compress(P),
+                f"Adding the identity point changed P for {curve_name}",
+            )
+        self.assertEqual(
+            curve.compress(curve.double(neutral)),
+            (1).to_bytes(32, "little"),
+            f"Doubling the identity point is not (0, 1) for {curve_name}",
+        )
+
+    @parameterized.expand(
+        [
+            (AffineEdwardsCurve(), "AffineEdwardsCurve"),
+            (ExtendedEdwardsCurve(), "ExtendedEdwardsCurve"),
+        ]
+    )  # type: ignore
+    def test_multi_scalar_mult(self, curve, curve_name) -> None:
+        """Test that the interleaved multiplication equals the sum of the terms."""
+        points = [curve.B, curve.double(curve.B), curve.scalar_mult(curve.B, 7), curve.B]
+        scalars = [secrets.randbelow(curve.q), secrets.randbits(128), 1, -5]
+        expected = IdentityPoint
+        for P, k in zip(points, scalars):
+            expected = curve.add(expected, curve.scalar_mult(P, k % curve.q))
+        self.assertTrue(
+            curve.point_equals(curve.multi_scalar_mult(points, scalars), expected),
+            f"Multi-scalar multiplication is wrong for {curve_name}",
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,7 +3,7 @@ import unittest
 
 from tonellishanks import tonellishanks
 
-from tonelli import tonelli
+from tonelli import find_nonsquare, legendre, legendre_symbol, tonelli
 
 
 class TestTonelliShanks(unittest.TestCase):
@@ -20,3 +20,29 @@ class TestTonelliShanks(unittest.TestCase):
             t2 = res**2 % p if res is not None else None
             self.assertEqual(t, t2, f"n: {n}, p: {p}")
             self.assertEqual(ts, res, f"n: {n}, p: {p}")
+
+    def test_find_nonsquare_is_smallest(self) -> None:
+        primes = [p for p in range(3, 2000) if all(p % d for d in range(2, p))]
+        for p in primes + [2**255 - 19]:
+            z = find_nonsquare(p)
+            self.assertEqual(legendre_symbol(z, p), -1, f"p: {p}")
+            self.assertTrue(
+                all(legendre_symbol(y, p) != -1 for y in range(2, z)), f"p: {p}"
+            )
+
+    def test_legendre_symbol_matches_euler(self) -> None:
+        for p in [3, 5, 7, 13, 2**127 - 1, 2**255 - 19]:
+            for _ in range(200):
+                a = random.randrange(-p, 2 * p)
+                euler = legendre(a, p)
+                expected = -1 if euler == p - 1 else euler
+                self.assertEqual(legendre_symbol(a, p), expected, f"a: {a}, p: {p}")
+
+    def test_tonelli_all_branches(self) -> None:
+        # p = 3 (mod 4), p = 5 (mod 8), and p = 1 (mod 8) with s up to 32.
+        for p in [2**127 - 1, 2**255 - 19, 17, 97, 2**64 - 2**32 + 1]:
+            for _ in range(50):
+                r = random.randrange(1, p)
+                root = tonelli(r * r % p, p)
+                self.assertIn(root, [r, p - r], f"p: {p}")
+            self.assertIsNone(tonelli(find_nonsquare(p), p), f"p: {p}")
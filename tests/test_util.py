@@ -3,13 +3,16 @@ import unittest
 
 from util import (
     affine_to_projective,
+    batch_modinv,
     clamp_scalar,
     cswap,
     decode_u,
     encode_u_coordinate,
     modinv,
+    pow_p58,
     projective_to_affine,
     sqrt_mod,
+    wnaf,
 )
 
 
@@ -73,6 +76,12 @@ class TestModInv(unittest.TestCase):
             inv = modinv(x, p)
             self.assertEqual((x * inv) % p, 1)
 
+    def test_modinv_curve25519_prime(self) -> None:
+        p = 2**255 - 19
+        self.assertEqual(modinv(2, p) * 2 % p, 1)
+        x = secrets.randbelow(p - 1) + 1
+        self.assertEqual(modinv(x, p) * x % p, 1)
+
     def test_modinv_zero(self) -> None:
         # Our impl modinv(0, p) returns 0,
         # even though 0 has no inverse.
@@ -80,6 +89,28 @@ class TestModInv(unittest.TestCase):
         self.assertEqual(modinv(0, p), 0)
 
 
+class TestBatchModinv(unittest.TestCase):
+    def test_batch_modinv_matches_modinv(self) -> None:
+        p = 2**255 - 19
+        xs = [secrets.randbelow(p) for _ in range(10)] + [0, p, 1]
+        self.assertEqual(batch_modinv(xs, p), [modinv(x, p) for x in xs])
+        self.assertEqual(batch_modinv([], p), [])
+
+
+class TestWnaf(unittest.TestCase):
+    def test_wnaf(self) -> None:
+        """Test that the wNAF digits are odd, bounded, sparse and sum to the scalar."""
+        for k in [0, 1, 31, 32, 2**255 - 19, secrets.randbits(256)]:
+            digits = wnaf(k, 5)
+            self.assertEqual(sum(d << i for i, d in enumerate(digits)), k)
+            non_zero = [i for i, d in enumerate(digits) if d != 0]
+            for i in non_zero:
+                self.assertEqual(digits[i] % 2, 1)
+                self.assertLess(abs(digits[i]), 16)
+            for i, j in zip(non_zero, non_zero[1:]):
+                self.assertGreaterEqual(j - i, 5)
+
+
 class TestSqrtMod(unittest.TestCase):
     def test_sqrt_mod_zero(self) -> None:
         p = 13
@@ -106,6 +137,16 @@ class TestSqrtMod(unittest.TestCase):
         # r should be either 11 or its negative modulo 13 (i.e. 2)
         self.assertIn(r, [11, 2])
 
+    def test_sqrt_mod_curve25519_prime(self) -> None:
+        p = 2**255 - 19
+        for _ in range(20):
+            r = secrets.randbelow(p)
+            a = r * r % p
+            self.assertIn(sqrt_mod(a, p), [r, p - r])
+            self.assertEqual(pow_p58(a), pow(a, (p - 5) // 8, p))
+        with self.assertRaises(ValueError):
+            sqrt_mod(2, p)
+
     def test_sqrt_mod_no_root(self) -> None:
         # For p = 13, choose a value that is not a quadratic residue.
         p = 13
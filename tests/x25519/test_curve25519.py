@@ -1,7 +1,8 @@
+import secrets
 import unittest
 from binascii import unhexlify
 
-from nacl.bindings import crypto_scalarmult
+from nacl.bindings import crypto_scalarmult, crypto_scalarmult_base
 from parameterized import parameterized
 
 from x25519.curve25519 import Curve25519
@@ -160,3 +161,33 @@ class TestCurve25519ImplementsRFC7748(unittest.TestCase):
                 u: {u_bytes.hex()}
                 """,
             )
+
+    @parameterized.expand(
+        [
+            ("MontgomeryLadderMKTutorial", MontgomeryLadderMKTutorial()),
+            ("MontgomeryLadderRFC7748", MontgomeryLadderRFC7748()),
+        ]
+    )  # type: ignore
+    def test_x25519_batch(self, name: str, impl: Curve25519) -> None:
+        """Test that x25519_batch agrees with calling x25519 on every pair."""
+        p = 2**255 - 19
+        scalars = [secrets.token_bytes(32) for _ in range(4)]
+        u_points = [secrets.token_bytes(32) for _ in range(3)]
+        # A non-canonical u = p + 9 (>= p) must be reduced like u = 9.
+        u_points.append((p + 9).to_bytes(32, "little"))
+        self.assertEqual(
+            impl.x25519_batch(scalars, u_points),
+            [impl.x25519(k, u) for k, u in zip(scalars, u_points)],
+            f"x25519_batch [{name}] does not match x25519 on every pair.",
+        )
+        self.assertEqual(
+            impl.x25519(scalars[-1], u_points[-1]),
+            impl.x25519(scalars[-1], (9).to_bytes(32, "little")),
+            f"x25519 [{name}] does not reduce a non-canonical u.",
+        )
+
+    def test_x25519_base_matches_nacl(self) -> None:
+        impl = MontgomeryLadderRFC7748()
+        for _ in range(50):
+            k_bytes = secrets.token_bytes(32)
+            self.assertEqual(impl.x25519_base(k_bytes), crypto_scalarmult_base(k_bytes))
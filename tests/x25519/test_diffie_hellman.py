@@ -186,6 +186,28 @@ class TestDiffieHellmanVectors(unittest.TestCase):
             msg=f"The two computed shared secrets do not match each other for {name}.",
         )
 
+    @parameterized.expand(
+        [
+            ("MontgomeryLadderRFC7748", MontgomeryLadderRFC7748()),
+            ("MontgomeryLadderMKTutorial", MontgomeryLadderMKTutorial()),
+        ]
+    )  # type: ignore
+    def test_shared_secrets_batch(self, name, curve) -> None:
+        private_key = PrivateKey()
+        dh = EllipticCurveDiffieHellman(private_key=private_key, curve=curve)
+        peers = [
+            EllipticCurveDiffieHellman(private_key=PrivateKey(), curve=curve).public_key
+            for _ in range(4)
+        ]
+
+        shared = dh.generate_shared_secrets(peers)
+
+        self.assertEqual(
+            [key.get_key() for key in shared],
+            [crypto_scalarmult(private_key.get_key(), peer.get_key()) for peer in peers],
+            msg=f"Batched shared secrets do not match PyNaCl for {name}.",
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 
+from curve import AffinePoint
 from x25519.group_law import Curve25519GroupLaw
 
 
@@ -18,6 +19,10 @@ class TestMontgomeryCurveOperations(unittest.TestCase):
             P, self.curve.B, "recover_point(9) did not return the expected BasePoint."
         )
 
+    def test_recover_point_two_torsion(self) -> None:
+        """X = 0 has the single root y = 0, which must not be replaced by p."""
+        self.assertEqual(self.curve.recover_point(0), AffinePoint(0, 0))
+
     def test_point_lies_on_curve(self) -> None:
         """
         Verify that a recovered point (or one produced by our group operations)
@@ -83,3 +88,20 @@ class TestMontgomeryCurveOperations(unittest.TestCase):
             pow(x, 3, self.curve.p) + self.curve.A * pow(x, 2, self.curve.p) + x
         ) % self.curve.p
         self.assertEqual(lhs, rhs, "3*P does not lie on the curve.")
+
+    def test_scalar_mult_matches_repeated_add(self) -> None:
+        """The projective scalar_mult must agree with the affine group law."""
+        P = self.curve.B
+        Q = P
+        for k in range(1, 20):
+            self.assertEqual(self.curve.scalar_mult(P, k), Q, f"{k}*P is wrong.")
+            Q = self.curve.add(Q, P)
+        T = self.curve.recover_point(0)
+        self.assertEqual(self.curve.scalar_mult(T, 3), T, "3*T for T of order 2.")
+        self.assertIsNone(self.curve.scalar_mult(T, 2), "2*T for T of order 2.")
+
+    def test_recover_point_rejects_non_square(self) -> None:
+        """The x-coordinate 2 has no point on the curve, also on a repeated call."""
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                self.curve.recover_point(2)